@@ -0,0 +1,49 @@
+
+# _expr_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'ADD COMMA DIV IDENT LBRACE LPAREN MUL NUMBER RBRACE RPAREN SUB UNDERSCOREexpr : expr ADD term\n            | expr SUB term\n            | termexprs : expr COMMA exprs\n             | exprterm : term MUL factor\n            | term DIV factor\n            | SUB term\n            | factorfactor : number variable\n              | number\n              | variable\n              | LPAREN expr RPAREN\n              | number LPAREN expr RPARENnumber : NUMBERvariable : IDENT UNDERSCORE IDENT\n                | IDENT UNDERSCORE number\n                | IDENT UNDERSCORE LBRACE exprs RBRACE\n                | IDENT'
+    
+_lr_action_items = {'SUB':([0,1,2,3,4,5,6,7,8,9,10,11,14,15,16,17,19,20,21,22,23,24,25,26,27,28,30,31,32,],[3,11,-3,3,-9,-11,-12,3,-15,-19,3,3,-8,-10,3,11,-1,-2,-6,-7,11,-13,-16,-17,3,-14,11,-18,3,]),'LPAREN':([0,3,5,7,8,10,11,12,13,16,27,32,],[7,7,16,7,-15,7,7,7,7,7,7,7,]),'NUMBER':([0,3,7,10,11,12,13,16,18,27,32,],[8,8,8,8,8,8,8,8,8,8,8,]),'IDENT':([0,3,5,7,8,10,11,12,13,16,18,27,32,],[9,9,9,9,-15,9,9,9,9,9,25,9,9,]),'$end':([1,2,4,5,6,8,9,14,15,19,20,21,22,24,25,26,28,31,],[0,-3,-9,-11,-12,-15,-19,-8,-10,-1,-2,-6,-7,-13,-16,-17,-14,-18,]),'ADD':([1,2,4,5,6,8,9,14,15,17,19,20,21,22,23,24,25,26,28,30,31,],[10,-3,-9,-11,-12,-15,-19,-8,-10,10,-1,-2,-6,-7,10,-13,-16,-17,-14,10,-18,]),'RPAREN':([2,4,5,6,8,9,14,15,17,19,20,21,22,23,24,25,26,28,31,],[-3,-9,-11,-12,-15,-19,-8,-10,24,-1,-2,-6,-7,28,-13,-16,-17,-14,-18,]),'COMMA':([2,4,5,6,8,9,14,15,19,20,21,22,24,25,26,28,30,31,],[-3,-9,-11,-12,-15,-19,-8,-10,-1,-2,-6,-7,-13,-16,-17,-14,32,-18,]),'RBRACE':([2,4,5,6,8,9,14,15,19,20,21,22,24,25,26,28,29,30,31,33,],[-3,-9,-11,-12,-15,-19,-8,-10,-1,-2,-6,-7,-13,-16,-17,-14,31,-5,-18,-4,]),'MUL':([2,4,5,6,8,9,14,15,19,20,21,22,24,25,26,28,31,],[12,-9,-11,-12,-15,-19,12,-10,12,12,-6,-7,-13,-16,-17,-14,-18,]),'DIV':([2,4,5,6,8,9,14,15,19,20,21,22,24,25,26,28,31,],[13,-9,-11,-12,-15,-19,13,-10,13,13,-6,-7,-13,-16,-17,-14,-18,]),'UNDERSCORE':([9,],[18,]),'LBRACE':([18,],[27,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'expr':([0,7,16,27,32,],[1,17,23,30,30,]),'term':([0,3,7,10,11,16,27,32,],[2,14,2,19,20,2,2,2,]),'factor':([0,3,7,10,11,12,13,16,27,32,],[4,4,4,4,4,21,22,4,4,4,]),'number':([0,3,7,10,11,12,13,16,18,27,32,],[5,5,5,5,5,5,5,5,26,5,5,]),'variable':([0,3,5,7,10,11,12,13,16,27,32,],[6,6,15,6,6,6,6,6,6,6,6,]),'exprs':([27,32,],[29,33,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> expr","S'",1,None,None,None),
+  ('expr -> expr ADD term','expr',3,'p_expr','simplify.py',129),
+  ('expr -> expr SUB term','expr',3,'p_expr','simplify.py',130),
+  ('expr -> term','expr',1,'p_expr','simplify.py',131),
+  ('exprs -> expr COMMA exprs','exprs',3,'p_exprs','simplify.py',140),
+  ('exprs -> expr','exprs',1,'p_exprs','simplify.py',141),
+  ('term -> term MUL factor','term',3,'p_term','simplify.py',149),
+  ('term -> term DIV factor','term',3,'p_term','simplify.py',150),
+  ('term -> SUB term','term',2,'p_term','simplify.py',151),
+  ('term -> factor','term',1,'p_term','simplify.py',152),
+  ('factor -> number variable','factor',2,'p_factor','simplify.py',163),
+  ('factor -> number','factor',1,'p_factor','simplify.py',164),
+  ('factor -> variable','factor',1,'p_factor','simplify.py',165),
+  ('factor -> LPAREN expr RPAREN','factor',3,'p_factor','simplify.py',166),
+  ('factor -> number LPAREN expr RPAREN','factor',4,'p_factor','simplify.py',167),
+  ('number -> NUMBER','number',1,'p_number','simplify.py',179),
+  ('variable -> IDENT UNDERSCORE IDENT','variable',3,'p_variable','simplify.py',184),
+  ('variable -> IDENT UNDERSCORE number','variable',3,'p_variable','simplify.py',185),
+  ('variable -> IDENT UNDERSCORE LBRACE exprs RBRACE','variable',5,'p_variable','simplify.py',186),
+  ('variable -> IDENT','variable',1,'p_variable','simplify.py',187),
+]
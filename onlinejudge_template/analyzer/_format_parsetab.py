@@ -0,0 +1,58 @@
+
+# _format_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'ADD COMMA DIV DOTS FONTSPEC IDENT LBRACE MUL NEWLINE NUMBER RBRACE SUB UNDERSCORE VDOTSmain : lines main\n            | lineslines : line\n             | line VDOTS newline line\n             | line DOTS newline linenewline : NEWLINEline : items newlineitems : item DOTS item items\n             | item DOTS item\n             | item items\n             | itemitem : IDENT\n            | IDENT UNDERSCORE NUMBER\n            | IDENT UNDERSCORE IDENT\n            | IDENT UNDERSCORE LBRACE exprs RBRACE\n            | FONTSPEC LBRACE item RBRACE\n            | LBRACE FONTSPEC item RBRACEexprs : expr COMMA exprs\n             | exprexpr : IDENT\n            | NUMBER\n            | NUMBER IDENT\n            | IDENT binop expr\n            | NUMBER binop exprbinop : ADD\n             | SUB\n             | MUL\n             | DIV'
+    
+_lr_action_items = {'IDENT':([0,2,3,5,6,12,13,14,16,17,18,19,20,21,22,23,24,27,28,33,34,35,36,37,38,39,40,41,42,44,],[6,6,-3,6,-12,-7,-6,6,22,6,6,6,6,6,-14,-13,30,-4,-5,43,-17,-16,30,-25,-26,-27,-28,-15,30,30,]),'FONTSPEC':([0,2,3,5,6,7,12,13,14,17,18,19,20,21,22,23,27,28,34,35,41,],[8,8,-3,8,-12,17,-7,-6,8,8,8,8,8,8,-14,-13,-4,-5,-17,-16,-15,]),'LBRACE':([0,2,3,5,6,8,12,13,14,16,17,18,19,20,21,22,23,27,28,34,35,41,],[7,7,-3,7,-12,18,-7,-6,7,24,7,7,7,7,7,-14,-13,-4,-5,-17,-16,-15,]),'$end':([1,2,3,9,12,13,27,28,],[0,-2,-3,-1,-7,-6,-4,-5,]),'VDOTS':([3,12,13,],[10,-7,-6,]),'DOTS':([3,5,6,12,13,22,23,34,35,41,],[11,14,-12,-7,-6,-14,-13,-17,-16,-15,]),'NEWLINE':([4,5,6,10,11,15,21,22,23,29,34,35,41,],[13,-11,-12,13,13,-10,-9,-14,-13,-8,-17,-16,-15,]),'RBRACE':([6,22,23,25,26,30,31,32,33,34,35,41,43,45,46,47,],[-12,-14,-13,34,35,-20,41,-19,-21,-17,-16,-15,-22,-23,-18,-24,]),'UNDERSCORE':([6,],[16,]),'NUMBER':([16,24,36,37,38,39,40,42,44,],[23,33,33,-25,-26,-27,-28,33,33,]),'COMMA':([30,32,33,43,45,47,],[-20,42,-21,-22,-23,-24,]),'ADD':([30,33,],[37,37,]),'SUB':([30,33,],[38,38,]),'MUL':([30,33,],[39,39,]),'DIV':([30,33,],[40,40,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'main':([0,2,],[1,9,]),'lines':([0,2,],[2,2,]),'line':([0,2,19,20,],[3,3,27,28,]),'items':([0,2,5,19,20,21,],[4,4,15,4,4,29,]),'item':([0,2,5,14,17,18,19,20,21,],[5,5,5,21,25,26,5,5,5,]),'newline':([4,10,11,],[12,19,20,]),'exprs':([24,42,],[31,46,]),'expr':([24,36,42,44,],[32,45,32,47,]),'binop':([30,33,],[36,44,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> main","S'",1,None,None,None),
+  ('main -> lines main','main',2,'p_main','parser.py',212),
+  ('main -> lines','main',1,'p_main','parser.py',213),
+  ('lines -> line','lines',1,'p_lines','parser.py',221),
+  ('lines -> line VDOTS newline line','lines',4,'p_lines','parser.py',222),
+  ('lines -> line DOTS newline line','lines',4,'p_lines','parser.py',223),
+  ('newline -> NEWLINE','newline',1,'p_newline','parser.py',231),
+  ('line -> items newline','line',2,'p_line','parser.py',236),
+  ('items -> item DOTS item items','items',4,'p_items','parser.py',241),
+  ('items -> item DOTS item','items',3,'p_items','parser.py',242),
+  ('items -> item items','items',2,'p_items','parser.py',243),
+  ('items -> item','items',1,'p_items','parser.py',244),
+  ('item -> IDENT','item',1,'p_item','parser.py',258),
+  ('item -> IDENT UNDERSCORE NUMBER','item',3,'p_item','parser.py',259),
+  ('item -> IDENT UNDERSCORE IDENT','item',3,'p_item','parser.py',260),
+  ('item -> IDENT UNDERSCORE LBRACE exprs RBRACE','item',5,'p_item','parser.py',261),
+  ('item -> FONTSPEC LBRACE item RBRACE','item',4,'p_item','parser.py',262),
+  ('item -> LBRACE FONTSPEC item RBRACE','item',4,'p_item','parser.py',263),
+  ('exprs -> expr COMMA exprs','exprs',3,'p_exprs','parser.py',275),
+  ('exprs -> expr','exprs',1,'p_exprs','parser.py',276),
+  ('expr -> IDENT','expr',1,'p_expr','parser.py',284),
+  ('expr -> NUMBER','expr',1,'p_expr','parser.py',285),
+  ('expr -> NUMBER IDENT','expr',2,'p_expr','parser.py',286),
+  ('expr -> IDENT binop expr','expr',3,'p_expr','parser.py',287),
+  ('expr -> NUMBER binop expr','expr',3,'p_expr','parser.py',288),
+  ('binop -> ADD','binop',1,'p_binop','parser.py',298),
+  ('binop -> SUB','binop',1,'p_binop','parser.py',299),
+  ('binop -> MUL','binop',1,'p_binop','parser.py',300),
+  ('binop -> DIV','binop',1,'p_binop','parser.py',301),
+]
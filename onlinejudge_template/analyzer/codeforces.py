@@ -25,7 +25,7 @@ def is_codeforces_url(url: str) -> bool:
 
 def has_multiple_testcases(html: bytes, *, url: str) -> bool:
     # parse HTML
-    soup = bs4.BeautifulSoup(html, 'html.parser')
+    soup = bs4.BeautifulSoup(html, 'lxml')
     input_specifications = soup.find_all('div', class_='input-specification')
     if len(input_specifications) != 1:
         logger.error("""<div class="input-specification"> is not found or not unique.""")
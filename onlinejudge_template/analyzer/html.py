@@ -71,34 +71,29 @@ def parse_generic_format_string(html: bytes, *, kind: str, url: str) -> str:
     :raises HTMLParserError:
     """
 
-    soup = bs4.BeautifulSoup(html, 'html.parser')
+    soup = bs4.BeautifulSoup(html, 'lxml')
     logger.debug('parsed HTML: %s...', repr(str(soup))[:200])
 
+    # Matching the heading text is done with the string= filter of find_all, so bs4 makes a single pass instead of one find_all per candidate check. CSS selectors cannot express this because they cannot match text.
     if 'atcoder.jp' in url:
-        for h3 in soup.find_all('h3'):
-            if h3.string in table[kind]:
-                pre = h3.parent.find('pre')
-                if pre:
-                    return _extract_format_string_from_pre(pre).strip() + '\r\n'
+        for h3 in soup.find_all('h3', string=table[kind]):
+            pre = h3.parent.find('pre')
+            if pre:
+                return _extract_format_string_from_pre(pre).strip() + '\r\n'
         raise HTMLParserError
 
     elif 'yukicoder.me' in url:
-        for h4 in soup.find_all('h4'):
-            if h4.string in table[kind]:
-                pre = h4.parent.find('pre')
-                if pre:
-                    return _extract_format_string_from_pre(pre).strip() + '\n'
+        for h4 in soup.find_all('h4', string=table[kind]):
+            pre = h4.parent.find('pre')
+            if pre:
+                return _extract_format_string_from_pre(pre).strip() + '\n'
         raise HTMLParserError
 
     elif 'yosupo.jp' in url:
         assert 'old.yosupo.jp' in url  # TODO: update this for new site https://judge.yosupo.jp/. The current implementation is for https://old.yosupo.jp/.
 
         for h2 in soup.find_all('h2'):
-            found = False
-            for div in h2.find_all('div'):
-                if div.string in table[kind]:
-                    found = True
-            if found:
+            if h2.find('div', string=table[kind]):
                 pre = h2.find_next_sibling('pre')
                 if pre:
                     code = pre.find('code')
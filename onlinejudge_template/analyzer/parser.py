@@ -29,6 +29,9 @@ the module to parse format strings and construct format trees
 """
 
 import abc
+import bisect
+import collections
+import functools
 import re
 from logging import getLogger
 from typing import *
@@ -36,7 +39,7 @@ from typing import *
 import ply.lex as lex
 import ply.yacc as yacc
 
-from onlinejudge_template.analyzer.simplify import simplify
+from onlinejudge_template.analyzer.simplify import simplify, simplify_equals
 from onlinejudge_template.types import *
 
 logger = getLogger(__name__)
@@ -69,50 +72,61 @@ tokens = (
 )
 
 
-def build_lexer() -> lex.Lexer:
-    def t_NEWLINE(t: lex.LexToken) -> lex.LexToken:
-        r"""(\r?\n|<br>)"""
-        t.lexer.lineno += 1
-        return t
+def t_NEWLINE(t: lex.LexToken) -> lex.LexToken:
+    r"""(\r?\n|<br>)"""
+    t.lexer.lineno += 1
+    return t
 
-    t_ignore = ' \t'
 
-    def t_tex_space(t: lex.LexToken) -> None:
-        r"""(\\[ ]|\\,|\\:|\\;|\\!|~|\\quad|\\qquad|\\hspace\{[^}]+\})"""
-        return None
+t_ignore = ' \t'
 
-    def t_math_mode(t: lex.LexToken) -> None:
-        r"""(\$|\\\(|\\\)|\\\[|\\\]|<var>|</var>)"""
-        return None
 
-    def t_error(t: lex.LexToken) -> None:
-        raise FormatStringParserError("lexer: unexpected character: '{}' at line {} column {}".format(t.value[0], t.lineno, t.lexpos))
+def t_tex_space(t: lex.LexToken) -> None:
+    r"""(\\[ ]|\\,|\\:|\\;|\\!|~|\\quad|\\qquad|\\hspace\{[^}]+\})"""
+    return None
 
-    # t_DOLLAR = r'\$'
-    # t_VAR_OPEN = r'<\s*[vV][aA][rR]\s*>'
-    # t_VAR_CLOSE = r'<\s*/\s*[vV][aA][rR]\s*>'
 
-    def t_FONTSPEC(t: lex.LexToken) -> lex.LexToken:
-        r"""\\(rm|mathrm|mathtt|mathbf|mathit|mathscr|mathcal|mathfrak|mathbb)"""
-        return t
+def t_math_mode(t: lex.LexToken) -> None:
+    r"""(\$|\\\(|\\\)|\\\[|\\\]|<var>|</var>)"""
+    return None
 
-    t_IDENT = r'[A-Za-z]+'
-    t_NUMBER = r'[0-9]+'
 
-    t_UNDERSCORE = r'_'
-    t_LBRACE = r'{'
-    t_RBRACE = r'}'
-    t_COMMA = r','
+def t_error(t: lex.LexToken) -> None:
+    raise FormatStringParserError("lexer: unexpected character: '{}' at line {} column {}".format(t.value[0], t.lineno, t.lexpos))
 
-    t_ADD = r'\+'
-    t_SUB = r'-'
-    t_MUL = r'(\*|×|\\times)'
-    t_DIV = r'/'
 
-    t_DOTS = r'(\.\.\.*|…|\\dots|\\ldots|\\cdots)'
-    t_VDOTS = r'(:|⋮|\\vdots)'
+# t_DOLLAR = r'\$'
+# t_VAR_OPEN = r'<\s*[vV][aA][rR]\s*>'
+# t_VAR_CLOSE = r'<\s*/\s*[vV][aA][rR]\s*>'
 
-    return lex.lex()
+
+def t_FONTSPEC(t: lex.LexToken) -> lex.LexToken:
+    r"""\\(rm|mathrm|mathtt|mathbf|mathit|mathscr|mathcal|mathfrak|mathbb)"""
+    return t
+
+
+t_IDENT = r'[A-Za-z]+'
+t_NUMBER = r'[0-9]+'
+
+t_UNDERSCORE = r'_'
+t_LBRACE = r'{'
+t_RBRACE = r'}'
+t_COMMA = r','
+
+def _alternatives(*patterns: str) -> str:
+    return '(' + '|'.join(patterns) + ')'
+
+
+t_ADD = r'\+'
+t_SUB = r'-'
+t_MUL = _alternatives(re.escape('*'), '×', re.escape(r'\times'))
+t_DIV = r'/'
+
+t_DOTS = _alternatives(r'\.\.\.*', '…', re.escape(r'\dots'), re.escape(r'\ldots'), re.escape(r'\cdots'))
+t_VDOTS = _alternatives(':', '⋮', re.escape(r'\vdots'))
+
+# Build the lexer only once at import time. Building it in run() costs more than the tokenization itself for short inputs.
+_lexer = lex.lex()
 
 
 class ParserNode(abc.ABC):
@@ -120,6 +134,8 @@ class ParserNode(abc.ABC):
     an internal representation which Yacc generates
     """
 
+    __slots__ = ('line', 'column')
+
     line: int
     column: int
 
@@ -140,6 +156,8 @@ class ParserNode(abc.ABC):
 
 
 class SequenceParserNode(ParserNode):
+    __slots__ = ('items', )
+
     items: List[ParserNode]
 
     def __init__(self, *, items: List[ParserNode], line: int, column: int):
@@ -148,10 +166,12 @@ class SequenceParserNode(ParserNode):
 
 
 class NewlineParserNode(ParserNode):
-    pass
+    __slots__ = ()
 
 
 class ItemParserNode(ParserNode):
+    __slots__ = ('name', 'indices')
+
     name: VarName
     indices: Tuple[Expr, ...]
 
@@ -162,6 +182,8 @@ class ItemParserNode(ParserNode):
 
 
 class DotsParserNode(ParserNode):
+    __slots__ = ('first', 'last')
+
     first: ParserNode
     last: ParserNode
 
@@ -171,289 +193,382 @@ class DotsParserNode(ParserNode):
         self.last = last
 
 
-def build_parser(*, input: str) -> yacc.LRParser:
-    def find_column(lexpos: int) -> int:
-        line_start = input.rfind('\n', 0, lexpos) + 1
-        return lexpos - line_start + 1
-
-    def loc(p: yacc.YaccProduction) -> Dict[str, int]:
-        return {
-            'line': p.lineno(1),
-            'column': find_column(p.lexpos(1)),
-        }
-
-    def p_main(p: yacc.YaccProduction) -> None:
-        """main : lines main
-                | lines"""
-        if len(p) == 3:
-            p[0] = SequenceParserNode(items=[p[1]] + p[2].items, **loc(p))
-        elif len(p) == 2:
-            p[0] = SequenceParserNode(items=[p[1]], **loc(p))
-
-    def p_lines(p: yacc.YaccProduction) -> None:
-        """lines : line
-                 | line VDOTS newline line
-                 | line DOTS newline line"""
-        if len(p) == 2:
-            p[0] = p[1]
-        elif len(p) == 5:
-            p[0] = DotsParserNode(first=p[1], last=p[4], **loc(p))
-
-    def p_newline(p: yacc.YaccProduction) -> None:
-        """newline : NEWLINE"""
-        p[0] = NewlineParserNode(**loc(p))
-
-    def p_line(p: yacc.YaccProduction) -> None:
-        """line : items newline"""
-        p[0] = SequenceParserNode(items=p[1].items + [p[2]], **loc(p))
-
-    def p_items(p: yacc.YaccProduction) -> None:
-        """items : item DOTS item items
-                 | item DOTS item
-                 | item items
-                 | item"""
-        if len(p) == 5:
-            dots = DotsParserNode(first=p[1], last=p[3], **loc(p))
-            p[0] = SequenceParserNode(items=[dots] + p[4].items, **loc(p))
-        if len(p) == 4:
-            dots = DotsParserNode(first=p[1], last=p[3], **loc(p))
-            p[0] = SequenceParserNode(items=[dots], **loc(p))
-        elif len(p) == 3:
-            p[0] = SequenceParserNode(items=[p[1]] + p[2].items, **loc(p))
-        elif len(p) == 2:
-            p[0] = SequenceParserNode(items=[p[1]], **loc(p))
-
-    def p_item(p: yacc.YaccProduction) -> None:
-        """item : IDENT
-                | IDENT UNDERSCORE NUMBER
-                | IDENT UNDERSCORE IDENT
-                | IDENT UNDERSCORE LBRACE exprs RBRACE
-                | FONTSPEC LBRACE item RBRACE
-                | LBRACE FONTSPEC item RBRACE"""
-        if len(p) == 2:
-            p[0] = ItemParserNode(name=p[1], indices=(), **loc(p))
-        elif len(p) == 4:
-            p[0] = ItemParserNode(name=p[1], indices=(p[3], ), **loc(p))
-        elif len(p) == 6:
-            p[0] = ItemParserNode(name=p[1], indices=p[4], **loc(p))
-        elif len(p) == 5:
-            p[0] = p[3]
-
-    def p_exprs(p: yacc.YaccProduction) -> None:
-        """exprs : expr COMMA exprs
-                 | expr"""
-        if len(p) == 4:
-            p[0] = (p[1], *p[3])
-        elif len(p) == 2:
-            p[0] = (p[1], )
-
-    def p_expr(p: yacc.YaccProduction) -> None:
-        """expr : IDENT
-                | NUMBER
-                | NUMBER IDENT
-                | IDENT binop expr
-                | NUMBER binop expr"""
-        if len(p) == 2:
-            p[0] = p[1]
-        elif len(p) == 3:
-            p[0] = f"""{p[1]} * {p[2]}"""
-        elif len(p) == 4:
-            p[0] = f"""{p[1]} {p[2]} {p[3]}"""
-
-    def p_binop(p: yacc.YaccProduction) -> None:
-        """binop : ADD
-                 | SUB
-                 | MUL
-                 | DIV"""
+# The offsets at which the lines of the currently parsed string start. run() computes this once per input, so that _find_column() is a binary search instead of a backwards scan per token.
+_line_starts: List[int] = [0]
+
+
+def _find_column(lexpos: int) -> int:
+    line_start = _line_starts[bisect.bisect_right(_line_starts, lexpos) - 1]
+    return lexpos - line_start + 1
+
+
+def _loc(p: yacc.YaccProduction) -> Dict[str, int]:
+    return {
+        'line': p.lineno(1),
+        'column': _find_column(p.lexpos(1)),
+    }
+
+
+def p_main(p: yacc.YaccProduction) -> None:
+    """main : lines main
+            | lines"""
+    if len(p) == 3:
+        p[0] = SequenceParserNode(items=[p[1]] + p[2].items, **_loc(p))
+    elif len(p) == 2:
+        p[0] = SequenceParserNode(items=[p[1]], **_loc(p))
+
+
+def p_lines(p: yacc.YaccProduction) -> None:
+    """lines : line
+             | line VDOTS newline line
+             | line DOTS newline line"""
+    if len(p) == 2:
+        p[0] = p[1]
+    elif len(p) == 5:
+        p[0] = DotsParserNode(first=p[1], last=p[4], **_loc(p))
+
+
+def p_newline(p: yacc.YaccProduction) -> None:
+    """newline : NEWLINE"""
+    p[0] = NewlineParserNode(**_loc(p))
+
+
+def p_line(p: yacc.YaccProduction) -> None:
+    """line : items newline"""
+    p[0] = SequenceParserNode(items=p[1].items + [p[2]], **_loc(p))
+
+
+def p_items(p: yacc.YaccProduction) -> None:
+    """items : item DOTS item items
+             | item DOTS item
+             | item items
+             | item"""
+    if len(p) == 5:
+        dots = DotsParserNode(first=p[1], last=p[3], **_loc(p))
+        p[0] = SequenceParserNode(items=[dots] + p[4].items, **_loc(p))
+    if len(p) == 4:
+        dots = DotsParserNode(first=p[1], last=p[3], **_loc(p))
+        p[0] = SequenceParserNode(items=[dots], **_loc(p))
+    elif len(p) == 3:
+        p[0] = SequenceParserNode(items=[p[1]] + p[2].items, **_loc(p))
+    elif len(p) == 2:
+        p[0] = SequenceParserNode(items=[p[1]], **_loc(p))
+
+
+def p_item(p: yacc.YaccProduction) -> None:
+    """item : IDENT
+            | IDENT UNDERSCORE NUMBER
+            | IDENT UNDERSCORE IDENT
+            | IDENT UNDERSCORE LBRACE exprs RBRACE
+            | FONTSPEC LBRACE item RBRACE
+            | LBRACE FONTSPEC item RBRACE"""
+    if len(p) == 2:
+        p[0] = ItemParserNode(name=p[1], indices=(), **_loc(p))
+    elif len(p) == 4:
+        p[0] = ItemParserNode(name=p[1], indices=(p[3], ), **_loc(p))
+    elif len(p) == 6:
+        p[0] = ItemParserNode(name=p[1], indices=p[4], **_loc(p))
+    elif len(p) == 5:
+        p[0] = p[3]
+
+
+def p_exprs(p: yacc.YaccProduction) -> None:
+    """exprs : expr COMMA exprs
+             | expr"""
+    if len(p) == 4:
+        p[0] = (p[1], *p[3])
+    elif len(p) == 2:
+        p[0] = (p[1], )
+
+
+def p_expr(p: yacc.YaccProduction) -> None:
+    """expr : IDENT
+            | NUMBER
+            | NUMBER IDENT
+            | IDENT binop expr
+            | NUMBER binop expr"""
+    if len(p) == 2:
         p[0] = p[1]
+    elif len(p) == 3:
+        p[0] = f"""{p[1]} * {p[2]}"""
+    elif len(p) == 4:
+        p[0] = f"""{p[1]} {p[2]} {p[3]}"""
 
-    def p_error(t: lex.LexToken) -> None:
-        raise FormatStringParserError("parser: unexpected token: {} \"{}\" at line {} column {}".format(t.type, t.value, t.lineno, find_column(t.lexpos)))
 
-    return yacc.yacc(debug=False, write_tables=False)
+def p_binop(p: yacc.YaccProduction) -> None:
+    """binop : ADD
+             | SUB
+             | MUL
+             | DIV"""
+    p[0] = p[1]
 
 
-def list_used_names(node: FormatNode) -> Set[str]:
-    if isinstance(node, ItemNode):
-        return set([node.name])
+def p_error(t: lex.LexToken) -> None:
+    raise FormatStringParserError("parser: unexpected token: {} \"{}\" at line {} column {}".format(t.type, t.value, t.lineno, _find_column(t.lexpos)))
 
-    elif isinstance(node, NewlineNode):
-        return set()
 
-    elif isinstance(node, SequenceNode):
-        names: Set[str] = set()
-        for item in node.items:
-            names |= list_used_names(item)
-        return names
+# Build the parser only once at import time. yacc.yacc() constructs the whole LALR table, which dominated the latency of run() when it was called every time.
+# The table is persisted as the module named by tabmodule, so the construction is skipped entirely as long as the grammar is unchanged.
+_parser = yacc.yacc(debug=False, tabmodule='onlinejudge_template.analyzer._format_parsetab')
 
-    elif isinstance(node, LoopNode):
-        return set([node.name]) | list_used_names(node.body)
 
-    else:
-        assert False
+def list_used_names(node: FormatNode) -> Set[str]:
+    names: Set[str] = set()
+    stack: List[FormatNode] = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ItemNode):
+            names.add(node.name)
+        elif isinstance(node, NewlineNode):
+            pass
+        elif isinstance(node, SequenceNode):
+            stack.extend(node.items)
+        elif isinstance(node, LoopNode):
+            names.add(node.name)
+            stack.append(node.body)
+        else:
+            assert False
+    return names
 
 
 def zip_nodes(a: FormatNode, b: FormatNode, *, name: VarName, size: Optional[Expr]) -> Tuple[FormatNode, Optional[Expr]]:
     """
     :raises FormatStringParserError:
+
+    This is implemented with an explicit stack instead of recursion, to avoid RecursionError and per-node call overhead on deeply nested trees.
     """
 
-    if isinstance(a, ItemNode) and isinstance(b, ItemNode):
-        if a.name != b.name or len(a.indices) != len(b.indices):
-            raise FormatStringParserError("semantics: unmatched dots pair: {} and {}".format(a, b))
-        indices = []
-        for i, j in zip(a.indices, b.indices):
-            if simplify(i) == simplify(j):
-                indices.append(i)
+    result: List[FormatNode] = []
+    # Each entry is ('zip', a, b, dest) to combine two nodes into dest, or ('sequence', dest, items) / ('loop', dest, loop, items) to collect already combined children.
+    stack: List[Tuple[Any, ...]] = [('zip', a, b, result)]
+    while stack:
+        op = stack.pop()
+        if op[0] == 'zip':
+            _, a_i, b_i, dest = op
+            # dispatch on the exact types; the node classes have no further subclasses
+            node_type = type(a_i)
+            if node_type is not type(b_i):
+                raise FormatStringParserError("semantics: unmatched dots pair: {} and {}".format(a_i, b_i))
+            if node_type is ItemNode:
+                if a_i.name != b_i.name or len(a_i.indices) != len(b_i.indices):
+                    raise FormatStringParserError("semantics: unmatched dots pair: {} and {}".format(a_i, b_i))
+                indices = []
+                for i, j in zip(a_i.indices, b_i.indices):
+                    if simplify_equals(i, j):
+                        indices.append(i)
+                    else:
+                        if size is None:
+                            size = simplify(Expr(f"""{j} - {i} + 1"""))
+                        else:
+                            if not simplify_equals(Expr(f"""{j} - {i} + 1"""), size):
+                                raise FormatStringParserError("semantics: unmatched dots pair: {} and {}".format(a_i, b_i))
+                        indices.append(simplify(Expr(f"{i} + {name}")))
+                dest.append(ItemNode(name=a_i.name, indices=indices))
+            elif node_type is NewlineNode:
+                dest.append(NewlineNode())
+            elif node_type is SequenceNode:
+                if len(a_i.items) != len(b_i.items):
+                    raise FormatStringParserError("semantics: unmatched dots pair: {} and {}".format(a_i, b_i))
+                items: List[FormatNode] = []
+                stack.append(('sequence', dest, items))
+                # push the children in reverse so that they are combined from left to right and `size` is found in document order
+                for a_j, b_j in zip(reversed(a_i.items), reversed(b_i.items)):
+                    stack.append(('zip', a_j, b_j, items))
+            elif node_type is LoopNode:
+                if a_i.size != b_i.size or a_i.name != b_i.name:
+                    raise FormatStringParserError("semantics: unmatched dots pair: {} and {}".format(a_i, b_i))
+                items = []
+                stack.append(('loop', dest, a_i, items))
+                stack.append(('zip', a_i.body, b_i.body, items))
             else:
-                if size is None:
-                    size = simplify(Expr(f"""{j} - {i} + 1"""))
-                else:
-                    if simplify(Expr(f"""{j} - {i} + 1""")) != simplify(size):
-                        raise FormatStringParserError("semantics: unmatched dots pair: {} and {}".format(a, b))
-                indices.append(simplify(Expr(f"{i} + {name}")))
-        return ItemNode(name=a.name, indices=indices), size
-
-    elif isinstance(a, NewlineNode) and isinstance(b, NewlineNode):
-        return NewlineNode(), size
-
-    elif isinstance(a, SequenceNode) and isinstance(b, SequenceNode):
-        if len(a.items) != len(b.items):
-            raise FormatStringParserError("semantics: unmatched dots pair: {} and {}".format(a, b))
-        items = []
-        for a_i, b_i in zip(a.items, b.items):
-            c_i, size = zip_nodes(a_i, b_i, name=name, size=size)
-            items.append(c_i)
-        return SequenceNode(items=items), size
-
-    elif isinstance(a, LoopNode) and isinstance(b, LoopNode):
-        if a.size != b.size or a.name != b.name:
-            raise FormatStringParserError("semantics: unmatched dots pair: {} and {}".format(a, b))
-        c, size = zip_nodes(a.body, b.body, name=name, size=size)
-        return LoopNode(size=a.size, name=a.name, body=c), size
+                raise FormatStringParserError("semantics: unmatched dots pair: {} and {}".format(a_i, b_i))
+        elif op[0] == 'sequence':
+            _, dest, items = op
+            dest.append(SequenceNode(items=items))
+        elif op[0] == 'loop':
+            _, dest, loop, items = op
+            dest.append(LoopNode(size=loop.size, name=loop.name, body=items[0]))
+        else:
+            assert False
+    return result[0], size
 
-    else:
-        raise FormatStringParserError("semantics: unmatched dots pair: {} and {}".format(a, b))
+
+@functools.lru_cache(maxsize=None)
+def _loop_counter_pattern(name: VarName) -> Pattern[str]:
+    """_loop_counter_pattern compiles the regex which matches the given loop counter as a whole word. The counters are single letters, so the cache stays tiny.
+    """
+
+    return re.compile(r'\b' + re.escape(name) + r'\b')
 
 
 def extend_loop_node(a: FormatNode, b: FormatNode, *, loop: LoopNode) -> Optional[FormatNode]:
-    if isinstance(a, ItemNode) and isinstance(b, ItemNode):
-        if a.name != b.name or len(a.indices) != len(b.indices):
-            return None
-        indices = []
-        for i, j in zip(a.indices, b.indices):
-            decr_j = Expr(re.subn(r'\b' + re.escape(loop.name) + r'\b', '(-1)', j)[0])
-            if simplify(i) == simplify(decr_j):
-                indices.append(simplify(Expr(f"""{i} + {loop.name}""")))
-            else:
+    result: List[FormatNode] = []
+    # the same stack-driven traversal as zip_nodes, but mismatches mean "not extendable" instead of errors
+    stack: List[Tuple[Any, ...]] = [('zip', a, b, result)]
+    while stack:
+        op = stack.pop()
+        if op[0] == 'zip':
+            _, a_i, b_i, dest = op
+            node_type = type(a_i)
+            if node_type is not type(b_i):
                 return None
-        return ItemNode(name=a.name, indices=indices)
-
-    elif isinstance(a, NewlineNode) and isinstance(b, NewlineNode):
-        return NewlineNode()
-
-    elif isinstance(a, SequenceNode) and isinstance(b, SequenceNode):
-        if len(a.items) != len(b.items):
-            return None
-        items = []
-        for a_i, b_i in zip(a.items, b.items):
-            c_i = extend_loop_node(a_i, b_i, loop=loop)
-            if c_i is None:
+            if node_type is ItemNode:
+                if a_i.name != b_i.name or len(a_i.indices) != len(b_i.indices):
+                    return None
+                indices = []
+                for i, j in zip(a_i.indices, b_i.indices):
+                    decr_j = Expr(_loop_counter_pattern(loop.name).sub('(-1)', j))
+                    if simplify_equals(i, decr_j):
+                        indices.append(simplify(Expr(f"""{i} + {loop.name}""")))
+                    else:
+                        return None
+                dest.append(ItemNode(name=a_i.name, indices=indices))
+            elif node_type is NewlineNode:
+                dest.append(NewlineNode())
+            elif node_type is SequenceNode:
+                if len(a_i.items) != len(b_i.items):
+                    return None
+                items: List[FormatNode] = []
+                stack.append(('sequence', dest, items))
+                for a_j, b_j in zip(reversed(a_i.items), reversed(b_i.items)):
+                    stack.append(('zip', a_j, b_j, items))
+            elif node_type is LoopNode:
+                if a_i.size != b_i.size or a_i.name != b_i.name:
+                    return None
+                items = []
+                stack.append(('loop', dest, a_i, items))
+                stack.append(('zip', a_i.body, b_i.body, items))
+            else:
                 return None
-            items.append(c_i)
-        return SequenceNode(items=items)
+        elif op[0] == 'sequence':
+            _, dest, items = op
+            dest.append(SequenceNode(items=items))
+        elif op[0] == 'loop':
+            _, dest, node, items = op
+            dest.append(LoopNode(size=node.size, name=node.name, body=items[0]))
+        else:
+            assert False
+    return result[0]
 
-    elif isinstance(a, LoopNode) and isinstance(b, LoopNode):
-        if a.size != b.size or a.name != b.name:
-            return None
-        c = extend_loop_node(a.body, b.body, loop=loop)
-        if c is None:
-            return None
-        return LoopNode(size=a.size, name=a.name, body=c)
 
-    else:
-        return None
+def _analyze_item_parser_node(node: ItemParserNode, results: Dict[int, FormatNode]) -> FormatNode:
+    indices = [simplify(index) for index in node.indices]
+    return ItemNode(name=node.name, indices=indices)
 
 
-def analyze_parsed_node(node: ParserNode) -> FormatNode:
-    """
-    translates an internal representation :any:`ParserNode` to a result tree :any:`FormatNode`
+def _analyze_newline_parser_node(node: NewlineParserNode, results: Dict[int, FormatNode]) -> FormatNode:
+    return NewlineNode()
 
-    :raises FormatStringParserError:
-    """
 
-    if isinstance(node, ItemParserNode):
-        indices = [simplify(index) for index in node.indices]
-        return ItemNode(name=node.name, indices=indices)
-
-    elif isinstance(node, NewlineParserNode):
-        return NewlineNode()
-
-    elif isinstance(node, SequenceParserNode):
-        items: List[FormatNode] = []
-        que: List[FormatNode] = list(map(analyze_parsed_node, node.items))
-        while que:
-            item, *que = que
-            if isinstance(item, SequenceNode):
-                # flatten SequenceNode in SequenceNode
-                que = item.items + que
-            elif isinstance(item, LoopNode) and items:
-                # merge FormatNode with LoopNode if possible
-                if isinstance(item.body, SequenceNode) and len(items) >= len(item.body.items):
-                    items_init = items[:-len(item.body.items)]
-                    items_tail: FormatNode = SequenceNode(items=items[-len(item.body.items):])
-                else:
-                    items_init = items[:-1]
-                    items_tail = items[-1]
-                extended_body = extend_loop_node(items_tail, item.body, loop=item)
-                if extended_body is not None:
-                    extended_loop: FormatNode = LoopNode(size=simplify(Expr(f"""{item.size} + 1""")), name=item.name, body=extended_body)
-                    items = items_init
-                    que = [extended_loop] + que
-                else:
-                    items.append(item)
+def _analyze_sequence_parser_node(node: SequenceParserNode, results: Dict[int, FormatNode]) -> FormatNode:
+    items: List[FormatNode] = []
+    # use a deque because popping from the front of a list is O(n) and this loop runs once per item of the sequence
+    que: Deque[FormatNode] = collections.deque(results[id(item)] for item in node.items)
+    while que:
+        item = que.popleft()
+        if isinstance(item, SequenceNode):
+            # flatten SequenceNode in SequenceNode
+            que.extendleft(reversed(item.items))
+        elif isinstance(item, LoopNode) and items:
+            # merge FormatNode with LoopNode if possible
+            if isinstance(item.body, SequenceNode) and len(items) >= len(item.body.items):
+                items_init = items[:-len(item.body.items)]
+                items_tail: FormatNode = SequenceNode(items=items[-len(item.body.items):])
+            else:
+                items_init = items[:-1]
+                items_tail = items[-1]
+            extended_body = extend_loop_node(items_tail, item.body, loop=item)
+            if extended_body is not None:
+                extended_loop: FormatNode = LoopNode(size=simplify(Expr(f"""{item.size} + 1""")), name=item.name, body=extended_body)
+                items = items_init
+                que.appendleft(extended_loop)
             else:
                 items.append(item)
-        if len(items) == 1:
-            # return the node directly if the length is 1
-            return items[0]
         else:
-            return SequenceNode(items=items)
+            items.append(item)
+    if len(items) == 1:
+        # return the node directly if the length is 1
+        return items[0]
+    else:
+        return SequenceNode(items=items)
 
-    elif isinstance(node, DotsParserNode):
-        a = analyze_parsed_node(node.first)
-        b = analyze_parsed_node(node.last)
 
-        # find the name of the new loop counter
-        used_names = list_used_names(a) | list_used_names(b)
-        name = VarName('i')
-        while name in used_names:
-            assert name != VarName('z')
-            name = VarName(chr(ord(name) + 1))
+# the candidates for the names of loop counters, in the order of preference
+_loop_counter_names = 'ijklmnopqrstuvwxyz'
 
-        # zip bodies
-        c, size = zip_nodes(a, b, name=name, size=None)
-        if size is None:
-            raise FormatStringParserError("semantics: unmatched dots pair: {} and {}".format(a, b))
-        return LoopNode(size=size, name=name, body=c)
 
+def _analyze_dots_parser_node(node: DotsParserNode, results: Dict[int, FormatNode]) -> FormatNode:
+    a = results[id(node.first)]
+    b = results[id(node.last)]
+
+    # find the name of the new loop counter
+    used_names = list_used_names(a) | list_used_names(b)
+    for c in _loop_counter_names:
+        if c not in used_names:
+            name = VarName(c)
+            break
     else:
         assert False
 
+    # zip bodies
+    c, size = zip_nodes(a, b, name=name, size=None)
+    if size is None:
+        raise FormatStringParserError("semantics: unmatched dots pair: {} and {}".format(a, b))
+    return LoopNode(size=size, name=name, body=c)
 
+
+# the dispatch table to translate each kind of :any:`ParserNode`; this replaces a chain of isinstance()
+_parser_node_analyzers: Dict[Type[ParserNode], Callable[[Any, Dict[int, FormatNode]], FormatNode]] = {
+    ItemParserNode: _analyze_item_parser_node,
+    NewlineParserNode: _analyze_newline_parser_node,
+    SequenceParserNode: _analyze_sequence_parser_node,
+    DotsParserNode: _analyze_dots_parser_node,
+}
+
+
+def analyze_parsed_node(node: ParserNode) -> FormatNode:
+    """
+    translates an internal representation :any:`ParserNode` to a result tree :any:`FormatNode`
+
+    :raises FormatStringParserError:
+
+    The tree is traversed in post order with an explicit stack, to avoid RecursionError and per-node call overhead on deeply nested trees.
+    """
+
+    results: Dict[int, FormatNode] = {}
+    stack: List[Tuple[ParserNode, bool]] = [(node, False)]
+    while stack:
+        n, is_ready = stack.pop()
+        if is_ready:
+            results[id(n)] = _parser_node_analyzers[type(n)](n, results)
+        else:
+            stack.append((n, True))
+            if isinstance(n, SequenceParserNode):
+                stack.extend([(item, False) for item in n.items])
+            elif isinstance(n, DotsParserNode):
+                stack.append((n.first, False))
+                stack.append((n.last, False))
+    return results[id(node)]
+
+
+@functools.lru_cache(maxsize=256)
 def run(pre: str) -> FormatNode:
     """
     :raises FormatStringParserError:
+
+    The results are memoized per format string, which is safe because :any:`FormatNode` objects are never modified after construction. The input and output format strings of a problem are analyzed several times while generating templates.
     """
 
+    global _line_starts
+    _line_starts = [0] + [i + 1 for i, c in enumerate(pre) if c == '\n']
+
     # list tokens with lex
-    lexer = build_lexer()
+    lexer = _lexer.clone()  # clone the precompiled lexer to keep its state isolated between calls
     lexer.input(pre)
     logger.debug('Lex tokens: %s', list(lexer.clone()))
 
     # make a tree with yacc
-    parser = build_parser(input=pre)
-    parsed = parser.parse(lexer=lexer)
+    parsed = _parser.parse(lexer=lexer)
     logger.debug('Yacc tree: %s', parsed)
 
     # analyze the syntax tree
@@ -15,6 +15,7 @@ the module to manipulate mathematical expressions (e.g. ``2 * n + 1``, ``a_i + i
 
 import abc
 import fractions
+import functools
 import re
 from logging import getLogger
 from typing import *
@@ -74,7 +75,7 @@ class _Constant(_Expr):
         return isinstance(other, self.__class__) and self.value == other.value
 
 
-_tokens = (
+tokens = (
     'IDENT',
     'NUMBER',
     'UNDERSCORE',
@@ -89,130 +90,138 @@ _tokens = (
     'DIV',
 )
 
+t_ignore = ' '
+
+
+def t_error(t: lex.LexToken) -> None:
+    raise ExprParserError("lexer: unexpected character: '{}' at line {} column {}".format(t.value[0], t.lineno, t.lexpos))
+
+
+t_IDENT = r'[A-Za-z]+'
+t_NUMBER = r'[0-9]+'
+
+t_UNDERSCORE = r'_'
+t_LBRACE = r'{'
+t_RBRACE = r'}'
+t_COMMA = r','
+
+t_LPAREN = r'\('
+t_RPAREN = r'\)'
+
+t_ADD = r'\+'
+t_SUB = r'-'
+t_MUL = r'\*'
+t_DIV = r'/'
+
+# Build the lexer only once at import time. Building it in _parse() costs more than the tokenization itself for short exprs.
+_lexer = lex.lex()
+
+# The string which is currently parsed. This is used only to report locations of errors.
+_input = ''
+
+
+def _find_column(lexpos: int) -> int:
+    line_start = _input.rfind('\n', 0, lexpos) + 1
+    return lexpos - line_start + 1
+
+
+def p_expr(p: yacc.YaccProduction) -> None:
+    """expr : expr ADD term
+            | expr SUB term
+            | term"""
+    if len(p) == 4:
+        op = {'+': _Function.ADD, '-': _Function.SUB}[p[2]]
+        p[0] = _Function(op, p[1], p[3])
+    elif len(p) == 2:
+        p[0] = p[1]
+
+
+def p_exprs(p: yacc.YaccProduction) -> None:
+    """exprs : expr COMMA exprs
+             | expr"""
+    if len(p) == 4:
+        p[0] = (p[1], *p[3])
+    elif len(p) == 2:
+        p[0] = (p[1], )
+
+
+def p_term(p: yacc.YaccProduction) -> None:
+    """term : term MUL factor
+            | term DIV factor
+            | SUB term
+            | factor"""
+    if len(p) == 4:
+        op = {'*': _Function.MUL, '/': _Function.DIV}[p[2]]
+        p[0] = _Function(op, p[1], p[3])
+    elif len(p) == 3:
+        p[0] = _Function(_Function.NEG, p[2])
+    elif len(p) == 2:
+        p[0] = p[1]
+
+
+def p_factor(p: yacc.YaccProduction) -> None:
+    """factor : number variable
+              | number
+              | variable
+              | LPAREN expr RPAREN
+              | number LPAREN expr RPAREN"""
+    if len(p) == 3:
+        p[0] = _Function(_Function.MUL, p[1], p[2])
+    elif len(p) == 2:
+        p[0] = p[1]
+    elif len(p) == 4:
+        p[0] = p[2]
+    elif len(p) == 5:
+        p[0] = _Function(_Function.MUL, p[1], p[3])
+
+
+def p_number(p: yacc.YaccProduction) -> None:
+    """number : NUMBER"""
+    p[0] = _Constant(int(p[1]))
+
+
+def p_variable(p: yacc.YaccProduction) -> None:
+    """variable : IDENT UNDERSCORE IDENT
+                | IDENT UNDERSCORE number
+                | IDENT UNDERSCORE LBRACE exprs RBRACE
+                | IDENT"""
+    if len(p) == 4 and isinstance(p[3], str):
+        p[0] = _Variable(p[1], _Variable(p[3]))
+    elif len(p) == 4 and isinstance(p[3], _Expr):
+        p[0] = _Variable(p[1], p[3])
+    elif len(p) == 6:
+        p[0] = _Variable(p[1], *p[4])
+    elif len(p) == 2:
+        p[0] = _Variable(p[1])
+
+
+def p_error(t: Optional[lex.LexToken]) -> None:
+    if t is None:
+        raise ExprParserError("parser: something wrong")
+    else:
+        raise ExprParserError("parser: unexpected token: {} \"{}\" at line {} column {}".format(t.type, t.value, t.lineno, _find_column(t.lexpos)))
 
-def _build_lexer() -> lex.Lexer:
-    tokens = _tokens
-
-    t_ignore = ' '
-
-    def t_error(t: lex.LexToken) -> None:
-        raise ExprParserError("lexer: unexpected character: '{}' at line {} column {}".format(t.value[0], t.lineno, t.lexpos))
-
-    t_IDENT = r'[A-Za-z]+'
-    t_NUMBER = r'[0-9]+'
-
-    t_UNDERSCORE = r'_'
-    t_LBRACE = r'{'
-    t_RBRACE = r'}'
-    t_COMMA = r','
-
-    t_LPAREN = r'\('
-    t_RPAREN = r'\)'
-
-    t_ADD = r'\+'
-    t_SUB = r'-'
-    t_MUL = r'\*'
-    t_DIV = r'/'
-
-    return lex.lex()
-
-
-def _build_parser(*, input: str) -> yacc.LRParser:
-    tokens = _tokens
-
-    def find_column(lexpos: int) -> int:
-        line_start = input.rfind('\n', 0, lexpos) + 1
-        return lexpos - line_start + 1
-
-    def loc(p: yacc.YaccProduction) -> Dict[str, int]:
-        return {
-            'line': p.lineno(1),
-            'column': find_column(p.lexpos(1)),
-        }
-
-    def p_expr(p: yacc.YaccProduction) -> None:
-        """expr : expr ADD term
-                | expr SUB term
-                | term"""
-        if len(p) == 4:
-            op = {'+': _Function.ADD, '-': _Function.SUB}[p[2]]
-            p[0] = _Function(op, p[1], p[3])
-        elif len(p) == 2:
-            p[0] = p[1]
-
-    def p_exprs(p: yacc.YaccProduction) -> None:
-        """exprs : expr COMMA exprs
-                 | expr"""
-        if len(p) == 4:
-            p[0] = (p[1], *p[3])
-        elif len(p) == 2:
-            p[0] = (p[1], )
-
-    def p_term(p: yacc.YaccProduction) -> None:
-        """term : term MUL factor
-                | term DIV factor
-                | SUB term
-                | factor"""
-        if len(p) == 4:
-            op = {'*': _Function.MUL, '/': _Function.DIV}[p[2]]
-            p[0] = _Function(op, p[1], p[3])
-        elif len(p) == 3:
-            p[0] = _Function(_Function.NEG, p[2])
-        elif len(p) == 2:
-            p[0] = p[1]
-
-    def p_factor(p: yacc.YaccProduction) -> None:
-        """factor : number variable
-                  | number
-                  | variable
-                  | LPAREN expr RPAREN
-                  | number LPAREN expr RPAREN"""
-        if len(p) == 3:
-            p[0] = _Function(_Function.MUL, p[1], p[2])
-        elif len(p) == 2:
-            p[0] = p[1]
-        elif len(p) == 4:
-            p[0] = p[2]
-        elif len(p) == 5:
-            p[0] = _Function(_Function.MUL, p[1], p[3])
-
-    def p_number(p: yacc.YaccProduction) -> None:
-        """number : NUMBER"""
-        p[0] = _Constant(int(p[1]))
-
-    def p_variable(p: yacc.YaccProduction) -> None:
-        """variable : IDENT UNDERSCORE IDENT
-                    | IDENT UNDERSCORE number
-                    | IDENT UNDERSCORE LBRACE exprs RBRACE
-                    | IDENT"""
-        if len(p) == 4 and isinstance(p[3], str):
-            p[0] = _Variable(p[1], _Variable(p[3]))
-        elif len(p) == 4 and isinstance(p[3], _Expr):
-            p[0] = _Variable(p[1], p[3])
-        elif len(p) == 6:
-            p[0] = _Variable(p[1], *p[4])
-        elif len(p) == 2:
-            p[0] = _Variable(p[1])
-
-    def p_error(t: Optional[lex.LexToken]) -> None:
-        if t is None:
-            raise ExprParserError("parser: something wrong")
-        else:
-            raise ExprParserError("parser: unexpected token: {} \"{}\" at line {} column {}".format(t.type, t.value, t.lineno, find_column(t.lexpos)))
 
-    return yacc.yacc(debug=False, write_tables=False)
+# Build the parser only once at import time. yacc.yacc() constructs the whole LALR table, which dominated the latency of _parse() when it was called every time.
+# The table is persisted as the module named by tabmodule, so the construction is skipped entirely as long as the grammar is unchanged.
+_parser = yacc.yacc(debug=False, tabmodule='onlinejudge_template.analyzer._expr_parsetab')
 
 
+@functools.lru_cache(maxsize=8192)
 def _parse(s: str) -> _Expr:
     """
     :raises ExprParserError:
+
+    The returned trees are shared between callers. This is safe because :any:`_Expr` objects are never modified after construction.
     """
 
+    global _input
+    _input = s
+
     try:
-        lexer = _build_lexer()
+        lexer = _lexer.clone()  # clone the precompiled lexer to keep its state isolated between calls
         lexer.input(s)
-        parser = _build_parser(input=s)
-        return parser.parse(lexer=lexer)
+        return _parser.parse(lexer=lexer)
     except ExprParserError as e:
         logger.debug('failed to parse {}: {}'.format(repr(s), e))
         raise
@@ -457,8 +466,11 @@ def _simplify_expr(e: _Expr) -> _Expr:
     return _convert_from_dnf(_simplify_dnf(_convert_to_dnf(e)))
 
 
+@functools.lru_cache(maxsize=4096)
 def simplify(s: Expr) -> Expr:
     """simplify converts the given expr to a simple expr.
+
+    The results are memoized because the analyzer calls this repeatedly on the same small exprs (e.g. ``1``, ``N``, ``i + 1``) and parsing dominates the cost.
     """
 
     try:
@@ -474,6 +486,14 @@ def simplify(s: Expr) -> Expr:
     return Expr(_format(simplified))
 
 
+@functools.lru_cache(maxsize=4096)
+def simplify_equals(s1: Expr, s2: Expr) -> bool:
+    """simplify_equals checks whether the given two exprs are equal modulo simplification.
+    """
+
+    return simplify(s1) == simplify(s2)
+
+
 def format_subscripted_variable(*, name: str, indices: List[str]) -> str:
     """format_subscripted_variable constructs a single expr from a variable name and indices
 
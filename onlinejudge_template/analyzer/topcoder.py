@@ -94,7 +94,7 @@ def parse_topcoder_class_definition(html: bytes, *, url: str) -> TopcoderClassDe
         example: https://community.topcoder.com/stat?c=problem_statement&pm=11213
     """
 
-    soup = bs4.BeautifulSoup(html, 'html.parser')
+    soup = bs4.BeautifulSoup(html, 'lxml')
     definition = _parse_topcoder_html(soup)
     return_type, formal_arguments = _parse_topcoder_method_signature(definition['Method signature'])
     class_definition = TopcoderClassDefinition(
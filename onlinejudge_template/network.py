@@ -17,6 +17,9 @@ logger = getLogger(__name__)
 
 
 def download_html(url: str, *, session: Optional[requests.Session] = None) -> bytes:
+    """download_html returns the HTML of the page as raw bytes. The bytes are deliberately not decoded here; the analyzers feed them to BeautifulSoup as is, so encoding detection runs only once, inside bs4.
+    """
+
     session = session or onlinejudge.utils.get_default_session()
     resp = session.get(url)
     logger.debug('HTTP response: %s', resp)
@@ -7,6 +7,11 @@ Expr = NewType('Expr', str)  # An expr. The type is always int. For example, "n
 
 
 class FormatNode(abc.ABC):
+    """FormatNode is a node of format trees. The nodes are never modified after construction, and they compare and hash structurally so that identical subtrees can be shared and memoized.
+    """
+
+    __slots__ = ()
+
     def __repr__(self) -> str:
         keys = dir(self)
         keys = list(filter(lambda key: not key.startswith('_'), keys))
@@ -16,6 +21,8 @@ class FormatNode(abc.ABC):
 
 
 class ItemNode(FormatNode):
+    __slots__ = ('name', 'indices')
+
     name: VarName
     indices: List[Expr]
 
@@ -23,19 +30,41 @@ class ItemNode(FormatNode):
         self.name = VarName(name)
         self.indices = list(map(Expr, indices))
 
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, self.__class__) and self.name == other.name and self.indices == other.indices
+
+    def __hash__(self) -> int:
+        return hash((self.__class__, self.name, tuple(self.indices)))
+
 
 class NewlineNode(FormatNode):
-    pass
+    __slots__ = ()
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, self.__class__)
+
+    def __hash__(self) -> int:
+        return hash(self.__class__)
 
 
 class SequenceNode(FormatNode):
+    __slots__ = ('items', )
+
     items: List[FormatNode]
 
     def __init__(self, *, items: Sequence[FormatNode]):
         self.items = list(items)
 
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, self.__class__) and self.items == other.items
+
+    def __hash__(self) -> int:
+        return hash((self.__class__, tuple(self.items)))
+
 
 class LoopNode(FormatNode):
+    __slots__ = ('size', 'name', 'body')
+
     size: Expr
     name: VarName  # TODO: rename `name` with `counter`
     body: FormatNode
@@ -45,6 +74,12 @@ class LoopNode(FormatNode):
         self.name = VarName(name)
         self.body = body
 
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, self.__class__) and self.size == other.size and self.name == other.name and self.body == other.body
+
+    def __hash__(self) -> int:
+        return hash((self.__class__, self.size, self.name, self.body))
+
 
 class SampleCase(NamedTuple):
     input: bytes
@@ -16,6 +16,7 @@ setup(
         'appdirs >= 1.4',
         'beautifulsoup4 >= 4.8',
         'colorlog >= 4.2.1',
+        'lxml >= 4.5',
         'Mako >= 1.1',
         'online-judge-api-client >= 10.8.0',
         'online-judge-tools >= 10',